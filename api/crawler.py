@@ -0,0 +1,242 @@
+from alfpyclient.common.connections import connect
+from alfpyclient.api.nodes import NodesAPI
+from alfpyclient.api.sites import SitesAPI
+from collections import deque
+from json import dumps, loads
+from multiprocessing import get_context
+from os import cpu_count, path
+from queue import Empty
+from requests import Session
+from typing import Dict, List, Callable, Iterator, Any
+from urllib.parse import quote
+
+_crawlFields = ['id', 'parentId', 'name', 'nodeType', 'isFolder']
+
+def compactRecord(nodeData:Dict):
+    return (nodeData['id'], nodeData.get('parentId'), nodeData.get('name'), nodeData.get('nodeType'), nodeData['isFolder'])
+
+class CrawlError(Exception):
+    def __init__(self, message:str, failedShards:Dict=None):
+        self.message = message
+        self.failedShards = failedShards if failedShards != None else {}
+
+    def __str__(self):
+        return self.message
+
+class _Checkpoint:
+    # append-only JSON lines file, only ever written by the parent process
+    def __init__(self, fileName:str):
+        self.__fileName = fileName
+        self.__file = None
+        self.shards = {}
+        self.done = set()
+
+        if fileName != None and path.exists(fileName):
+            with open(fileName, 'r') as f:
+                for line in f:
+                    line = line.strip()
+                    if len(line) == 0:
+                        continue
+                    # tolerate a truncated last line from a crash
+                    try:
+                        entry = loads(line)
+                    except ValueError:
+                        continue
+                    if 'shard' in entry:
+                        self.shards[entry['shard']] = entry.get('parent')
+                    elif 'done' in entry:
+                        self.done.add(entry['done'])
+
+    def __write(self, entry:Dict):
+        if self.__fileName == None:
+            return
+        if self.__file == None:
+            self.__file = open(self.__fileName, 'a')
+        self.__file.write(dumps(entry) + '\n')
+        self.__file.flush()
+
+    def registerShard(self, shardId:str, parentShardId:str=None):
+        if shardId not in self.shards:
+            self.shards[shardId] = parentShardId
+            self.__write({'shard': shardId, 'parent': parentShardId})
+
+    def completeShard(self, shardId:str):
+        self.done.add(shardId)
+        self.__write({'done': shardId})
+
+    def pendingShards(self):
+        return [shardId for shardId in self.shards if shardId not in self.done]
+
+    def splitShards(self, shardId:str):
+        return [childId for childId, parentId in self.shards.items() if parentId == shardId]
+
+    def close(self):
+        if self.__file != None:
+            self.__file.close()
+            self.__file = None
+
+def _crawlShard(client:Any, shardId:str, excluded:List[str], emitRoot:bool, fields:List[str], pageSize:int, recordMapper:Callable[[Dict], Any], workQueue:Any, resultQueue:Any, idleWorkers:Any):
+    # roots of split-off shards have already been emitted while listing their parent
+    if emitRoot:
+        rootData = client.get('alfresco', 'nodes/' + quote(shardId), params={'fields': fields})
+        resultQueue.put(('records', shardId, [recordMapper(rootData)]))
+        if not rootData['isFolder']:
+            return
+
+    excludedIds = set(excluded)
+    # breadth-first from the left (shallow folders), depth-first from the right
+    pendingFolders = deque([shardId])
+    while len(pendingFolders) > 0:
+        folderId = pendingFolders.pop()
+        opUrl = 'nodes/' + quote(folderId) + '/children'
+        skipCount = 0
+        hasMoreItems = True
+        while hasMoreItems:
+            params = {'skipCount': skipCount, 'maxItems': pageSize, 'fields': fields, 'where': '(isPrimary=true)'}
+            childrenListResult = client.get('alfresco', opUrl, params=params)
+            childEntries = childrenListResult['list']['entries']
+            records = []
+            for childEntry in childEntries:
+                nodeData = childEntry['entry']
+                records.append(recordMapper(nodeData))
+                if nodeData['isFolder'] and nodeData['id'] not in excludedIds:
+                    pendingFolders.append(nodeData['id'])
+            if len(records) > 0:
+                resultQueue.put(('records', shardId, records))
+            skipCount += len(childEntries)
+            hasMoreItems = childrenListResult['list']['pagination']['hasMoreItems'] and len(childEntries) > 0
+
+        # hand off the shallowest pending folder as a new shard while other workers are starving (approximate, good enough for balancing)
+        if len(pendingFolders) > 1 and idleWorkers.value > 0 and workQueue.empty():
+            resultQueue.put(('split', shardId, pendingFolders.popleft()))
+
+def _crawlWorker(connectArgs:Dict, fields:List[str], pageSize:int, recordMapper:Callable[[Dict], Any], workQueue:Any, resultQueue:Any, idleWorkers:Any):
+    # each worker process uses its own client / session
+    client = connect(**connectArgs)
+    while True:
+        with idleWorkers.get_lock():
+            idleWorkers.value += 1
+        task = workQueue.get()
+        with idleWorkers.get_lock():
+            idleWorkers.value -= 1
+        if task == None:
+            break
+
+        shardId, excluded, emitRoot = task
+        try:
+            _crawlShard(client, shardId, excluded, emitRoot, fields, pageSize, recordMapper, workQueue, resultQueue, idleWorkers)
+            resultQueue.put(('done', shardId, None))
+        except Exception as e:
+            resultQueue.put(('failed', shardId, str(e)))
+
+class ShardedCrawler:
+    def __init__(self, baseUrl:str, userName:str=None, password:str=None, ticket:str=None, sessionFactory:Callable[[], Any]=Session, workers:int=None, checkpointFile:str=None, recordMapper:Callable[[Dict], Any]=compactRecord, fields:List[str]=None, pageSize:int=100):
+        # everything passed to worker processes must be picklable, so workers connect by themselves
+        self.__connectArgs = {'baseUrl': baseUrl, 'userName': userName, 'password': password, 'ticket': ticket, 'sessionFactory': sessionFactory}
+        self.__client = None
+        self.__workers = workers if workers != None else (cpu_count() or 1)
+        self.__checkpointFile = checkpointFile
+        self.__recordMapper = recordMapper
+        self.__pageSize = pageSize
+
+        self.__fields = list(fields) if fields != None else list(_crawlFields)
+        for requiredField in ['id', 'isFolder']:
+            if len(self.__fields) > 0 and requiredField not in self.__fields:
+                self.__fields.append(requiredField)
+
+    def __getClient(self):
+        if self.__client == None:
+            self.__client = connect(**self.__connectArgs)
+        return self.__client
+
+    def siteShards(self, siteIds:List[str]):
+        sitesApi = SitesAPI(self.__getClient())
+        shardIds = []
+        for siteId in siteIds:
+            shardIds.append(sitesApi.getSite(siteId, fields=['id']).getDocumentLibrary().id)
+        return shardIds
+
+    def folderShards(self, nodeId:str, relativePath:str=None):
+        # every primary child becomes a shard (documents only yield their own record), the node itself is not included
+        nodesApi = NodesAPI(self.__getClient())
+        rootNode = nodesApi.getNode(nodeId, relativePath=relativePath, fields=['id'])
+        shardIds = []
+        opUrl = 'nodes/' + quote(rootNode.id) + '/children'
+        skipCount = 0
+        hasMoreItems = True
+        while hasMoreItems:
+            params = {'skipCount': skipCount, 'maxItems': self.__pageSize, 'fields': ['id'], 'where': '(isPrimary=true)'}
+            childrenListResult = self.__getClient().get('alfresco', opUrl, params=params)
+            childEntries = childrenListResult['list']['entries']
+            for childEntry in childEntries:
+                shardIds.append(childEntry['entry']['id'])
+            skipCount += len(childEntries)
+            hasMoreItems = childrenListResult['list']['pagination']['hasMoreItems'] and len(childEntries) > 0
+        return shardIds
+
+    def crawl(self, shardIds:List[str]) -> Iterator[Any]:
+        # yields the records of the shard roots and all their descendants as they are streamed back from the workers
+        checkpoint = _Checkpoint(self.__checkpointFile)
+        context = get_context()
+        workQueue = context.Queue()
+        # bounded so that workers block instead of buffering records when the consumer is slow
+        resultQueue = context.Queue(maxsize=max(1, self.__workers) * 4)
+        idleWorkers = context.Value('i', 0)
+        processes = []
+        failedShards = {}
+
+        try:
+            for shardId in shardIds:
+                checkpoint.registerShard(shardId)
+            outstanding = 0
+            for shardId in checkpoint.pendingShards():
+                # sub-shards split off in a previous run must not be crawled again as part of their parent
+                # only the initial shards (without parent) emit their root record
+                workQueue.put((shardId, checkpoint.splitShards(shardId), checkpoint.shards[shardId] == None))
+                outstanding += 1
+
+            if outstanding == 0:
+                return
+
+            # workers beyond the number of initial shards still pick up split-off sub-shards
+            for i in range(max(1, self.__workers)):
+                process = context.Process(target=_crawlWorker, args=(self.__connectArgs, self.__fields, self.__pageSize, self.__recordMapper, workQueue, resultQueue, idleWorkers), daemon=True)
+                process.start()
+                processes.append(process)
+
+            while outstanding > 0:
+                try:
+                    messageType, shardId, value = resultQueue.get(timeout=1)
+                except Empty:
+                    for process in processes:
+                        if not process.is_alive():
+                            raise CrawlError('Crawl worker ' + str(process.pid) + ' died with exit code ' + str(process.exitcode), failedShards)
+                    continue
+
+                if messageType == 'records':
+                    for record in value:
+                        yield record
+                elif messageType == 'split':
+                    # split needs to be checkpointed before the parent shard can complete
+                    checkpoint.registerShard(value, shardId)
+                    workQueue.put((value, [], False))
+                    outstanding += 1
+                elif messageType == 'done':
+                    checkpoint.completeShard(shardId)
+                    outstanding -= 1
+                elif messageType == 'failed':
+                    failedShards[shardId] = value
+                    outstanding -= 1
+
+            for process in processes:
+                workQueue.put(None)
+            for process in processes:
+                process.join()
+        finally:
+            checkpoint.close()
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+
+        if len(failedShards) > 0:
+            raise CrawlError(str(len(failedShards)) + ' shard(s) failed - re-run with the same checkpoint file to retry', failedShards)
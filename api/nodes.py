@@ -337,6 +337,7 @@ class _InternalNodesAPI:
 class NodesAPI:
     def __init__(self, client:Client):
         self.__client = client
+        self.__api = _InternalNodesAPI(client)
 
     def getCompanyHome(self):
         return self.getNode('-root-')
@@ -362,6 +363,5 @@ class NodesAPI:
         if isLocked:
             includes.append('isLocked')
     
-        api = _InternalNodesAPI(self.__client)
-        node = api.loadNode(id, relativePath, includes, fields)
+        node = self.__api.loadNode(id, relativePath, includes, fields)
         return node
\ No newline at end of file
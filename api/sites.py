@@ -56,6 +56,7 @@ class Site:
 class _InternalSitesAPI:
     def __init__(self, client:Client):
         self.__client = client
+        self.__nodesApi = NodesAPI(client)
     
     def loadSite(self, siteId:str, relations:List[str]=None, fields:List[str]=None):
         loadParameters = {'relations': []}
@@ -89,22 +90,20 @@ class _InternalSitesAPI:
         return siteData
     
     def loadSiteNode(self, siteGuid:str):
-        nodesApi = NodesAPI(self.__client)
-        siteNode = nodesApi.getNode(guid)
+        siteNode = self.__nodesApi.getNode(siteGuid)
         return siteNode
     
     def loadSiteContainerNode(self, siteId:str, containerId:str):
         opUrl = 'sites/' + quote(siteId) + '/containers/' + quote(containerId)
         siteContainerData = self.__client.get('alfresco', opUrl)
-        nodesApi = NodesAPI(self.__client)
-        siteContainerNode = nodesApi.getNode(siteContainerData['id'])
+        siteContainerNode = self.__nodesApi.getNode(siteContainerData['id'])
         return siteContainerNode
 
 class SitesAPI:
     def __init__(self, client:Client):
         self.__client = client
+        self.__api = _InternalSitesAPI(client)
     
     def getSite(self, siteId:str, relations:List[str]=None, fields:List[str]=None):
-        api = _InternalSitesAPI(self.__client)
-        site = api.loadSite(siteId, relations, fields)
+        site = self.__api.loadSite(siteId, relations, fields)
         return site
\ No newline at end of file
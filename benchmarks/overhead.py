@@ -0,0 +1,46 @@
+from alfpyclient.common.connections import Client
+from alfpyclient.api.nodes import NodesAPI
+from timeit import repeat
+from typing import Dict
+
+# Micro-benchmark of the client-side overhead per request, i.e. without any network I/O
+# run via: python -m alfpyclient.benchmarks.overhead
+
+_CALLS = 100000
+_REPEATS = 5
+
+class _StubResponse:
+    status_code = 200
+    headers = {'Content-type': 'application/json;charset=UTF-8'}
+
+    def json(self):
+        return {'entry': {'id': 'abc', 'name': 'stub'}}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+class _StubSession:
+    def __init__(self):
+        self.headers = {}
+
+    def get(self, url:str, params:Dict=None, headers:Dict=None, stream:bool=False):
+        return _StubResponse()
+
+def _measure(name:str, call):
+    perCall = min(repeat(call, number=_CALLS, repeat=_REPEATS)) / _CALLS
+    print('%-20s %.2f us/call' % (name, perCall * 1e6))
+
+def main():
+    client = Client('http://localhost:8080/alfresco', sessionFactory=_StubSession)
+    client.useTicket('TICKET_stub')
+    nodesApi = NodesAPI(client)
+    params = {'include': ['path', 'permissions'], 'fields': ['id', 'name']}
+
+    _measure('Client.get', lambda: client.get('alfresco', 'nodes/abc', params=params))
+    _measure('NodesAPI.getNode', lambda: nodesApi.getNode('abc', path=True))
+
+if __name__ == '__main__':
+    main()
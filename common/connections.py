@@ -1,16 +1,21 @@
-from alfpyclient.common.errors import handleErrorResponse
-from collections import OrderedDict
+from alfpyclient.common.errors import handleErrorResponse, _jsonContentType
 from base64 import b64encode
 from requests import Session, Response
-from re import search
+import re
 from typing import Dict, Callable, Any
 
+_textContentType = re.compile('^text/.+(;charset=.+)?$')
+
 
 class Client:
-    def __init__(self, baseUrl: str):
+    # sessionFactory may provide any transport with the get/post/put/delete/headers interface of requests.Session
+    def __init__(self, baseUrl: str, sessionFactory: Callable[[], Any] = Session):
         self.__baseUrl = baseUrl
+        self.__sessionFactory = sessionFactory
         self.__ticket = None
         self.__session = None
+        # URL prefixes per (api, version) so that requests only need to append the operation URL
+        self.__urlPrefixes = {}
 
     def __updateTicket(self, ticket: str = None):
         if ticket is not None:
@@ -21,38 +26,33 @@ class Client:
             self.__session.headers.update({'Authorization': basicStr})
 
     def __processRequest(self, api: str, opUrl: str, version: str, params: Dict, headers: Dict, responseHandler: Callable[[Response], Any], errorHandler: Callable[[Response], Any], requestHandler: Callable[[str, Dict, Dict, Dict, Any], Any], payload: Any = None, files: Dict = None):
-        effectiveVersion = '1'
-        if version is not None:
-            effectiveVersion = version
-        effectiveUrl = self.__baseUrl + '/api/-default-/public/' + api + '/versions/' + effectiveVersion + '/' + opUrl
-
-        # OrderedDict to keep any ordering in provided data during mapping
-        effectiveParams = OrderedDict()
-        effectiveHeaders = OrderedDict()
-        effectiveFiles = OrderedDict()
-
+        urlPrefix = self.__urlPrefixes.get((api, version))
+        if urlPrefix is None:
+            effectiveVersion = '1'
+            if version is not None:
+                effectiveVersion = version
+            urlPrefix = self.__baseUrl + '/api/-default-/public/' + api + '/versions/' + effectiveVersion + '/'
+            self.__urlPrefixes[(api, version)] = urlPrefix
+        effectiveUrl = urlPrefix + opUrl
+
+        # dict keeps any ordering in provided data during mapping
+        effectiveParams = None
         if params is not None:
-            for k in params:
-                if isinstance(params[k], list):
-                    if len(params[k]) > 0:
+            effectiveParams = {}
+            for k, v in params.items():
+                if isinstance(v, list):
+                    if len(v) > 0:
                         # Public v1 ReST API always expects concatenated multi-value params
-                        effectiveParams[k] = ','.join(params[k])
+                        effectiveParams[k] = ','.join(v)
                 else:
-                    effectiveParams[k] = params[k]
-
-        if headers is not None:
-            for k in headers:
-                effectiveHeaders[k] = headers[k]
-
-        if files is not None:
-            for k in files:
-                effectiveFiles[k] = files[k]
+                    effectiveParams[k] = v
 
+        # headers / files are passed through as-is since they are never modified
         if self.__session is None:
-            self.__session = Session()
+            self.__session = self.__sessionFactory()
             self.__updateTicket()
 
-        with requestHandler(effectiveUrl, effectiveParams, effectiveHeaders, effectiveFiles, payload) as response:
+        with requestHandler(effectiveUrl, effectiveParams, headers, files, payload) as response:
             return self.__processResponse(response, responseHandler, errorHandler)
 
     def __doGet(self, efUrl: str, efParams: Dict, efHeaders: Dict, efFiles: Dict,payload: Any):
@@ -88,12 +88,13 @@ class Client:
             if responseHandler is not None:
                 return responseHandler(response)
             if response.status_code != 204:
-                if search('^application/json(;charset=.+)?$', response.headers['Content-type']):
+                contentType = response.headers['Content-type']
+                if _jsonContentType.match(contentType):
                     jsonRes = response.json()
                     if 'entry' in jsonRes:
                         return jsonRes['entry']
                     return jsonRes
-                if search('^text/.+(;charset=.+)?$', response.headers['Content-type']):
+                if _textContentType.match(contentType):
                     return response.text
                 return response.content
         # TODO What to do about 100/300 response status codes? (redirection already handled by requests)
@@ -119,8 +120,8 @@ class Client:
         return self.__processRequest(api, opUrl, version, payload=payload, params=params, headers=headers, responseHandler=responseHandler, errorHandler=errorHandler, requestHandler=self.__doJsonPut)
 
 
-def connect(baseUrl: str, userName: str = None, password: str = None, ticket: str = None):
-    client = Client(baseUrl)
+def connect(baseUrl: str, userName: str = None, password: str = None, ticket: str = None, sessionFactory: Callable[[], Any] = Session):
+    client = Client(baseUrl, sessionFactory)
     if ticket is not None:
         client.useTicket(ticket)
     elif userName is not None and password is not None:
@@ -1,6 +1,8 @@
 from requests import Response
 import re
 
+_jsonContentType = re.compile('^application/json(;charset=.+)?$')
+
 
 class RequestError(Exception):
     def __init__(self, response: Response):
@@ -63,7 +65,7 @@ _errorSwitcher = {
 
 
 def _extractResponseMessage(response: Response):
-    if re.search('^application/json(;charset=.+)?$', response.headers['Content-type']):
+    if _jsonContentType.match(response.headers['Content-type']):
         jsonResponse = response.json()
         if 'error' in jsonResponse and 'briefSummary' in jsonResponse['error']:
             return jsonResponse['error']['briefSummary']